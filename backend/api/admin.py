@@ -3,34 +3,42 @@ Admin configuration for Chemical Equipment models.
 Allows administrators to view and manage datasets through Django admin.
 """
 from django.contrib import admin
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.html import format_html
 from .models import Dataset, Equipment
 
 
-class EquipmentInline(admin.TabularInline):
-    """
-    Inline display of Equipment within Dataset admin.
-    Shows equipment records directly in the dataset detail page.
-    """
-    model = Equipment
-    extra = 0  # Don't show empty forms for new records
-    readonly_fields = ['name', 'equipment_type', 'flowrate', 'pressure', 'temperature']
-
-
 @admin.register(Dataset)
 class DatasetAdmin(admin.ModelAdmin):
     """
     Admin configuration for Dataset model.
     """
     list_display = ['filename', 'user', 'uploaded_at', 'equipment_count']
+    list_select_related = ['user']  # Join users instead of querying per row
     list_filter = ['user', 'uploaded_at']
     search_fields = ['filename', 'user__username']
-    readonly_fields = ['summary_json', 'uploaded_at']
-    inlines = [EquipmentInline]
+    readonly_fields = ['summary_json', 'uploaded_at', 'equipment_link']
+    
+    def get_queryset(self, request):
+        """Annotate equipment counts so the changelist avoids a query per row."""
+        return super().get_queryset(request).annotate(_eq_count=Count('equipment'))
     
     def equipment_count(self, obj):
         """Display the number of equipment records in this dataset."""
-        return obj.equipment.count()
+        return obj._eq_count
     equipment_count.short_description = 'Equipment Count'
+    equipment_count.admin_order_field = '_eq_count'
+    
+    def equipment_link(self, obj):
+        """
+        Link to the paginated equipment list filtered to this dataset.
+        Used instead of an inline, which would render every equipment row
+        as a form on the dataset page.
+        """
+        url = reverse('admin:api_equipment_changelist') + f'?dataset__id__exact={obj.pk}'
+        return format_html('<a href="{}">View {} equipment records</a>', url, obj._eq_count)
+    equipment_link.short_description = 'Equipment'
 
 
 @admin.register(Equipment)
@@ -39,5 +47,6 @@ class EquipmentAdmin(admin.ModelAdmin):
     Admin configuration for Equipment model.
     """
     list_display = ['name', 'equipment_type', 'flowrate', 'pressure', 'temperature', 'dataset']
+    list_select_related = ['dataset']  # Join datasets instead of querying per row
     list_filter = ['equipment_type', 'dataset']
     search_fields = ['name', 'equipment_type']
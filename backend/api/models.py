@@ -4,7 +4,11 @@ Defines Dataset (upload session) and Equipment (individual records) models.
 """
 from django.db import models
 from django.contrib.auth.models import User
-import json
+import orjson
+
+# orjson serializes numpy scalars natively and tolerates non-string dict keys
+# (e.g. numeric equipment types coming out of pandas value_counts)
+SUMMARY_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 
 class Dataset(models.Model):
@@ -29,34 +33,54 @@ class Dataset(models.Model):
     class Meta:
         # Order by most recent first
         ordering = ['-uploaded_at']
+        # Serves the per-user "most recent first" lookups (history list, limit trimming)
+        indexes = [models.Index(fields=['user', '-uploaded_at'])]
     
     def __str__(self):
         return f"{self.filename} - {self.uploaded_at.strftime('%Y-%m-%d %H:%M')}"
     
     @property
     def summary(self):
-        """Parse and return the summary as a dictionary."""
-        return json.loads(self.summary_json)
+        """Parse and return the summary as a dictionary, caching the result."""
+        if not hasattr(self, '_summary_cache'):
+            self._summary_cache = orjson.loads(self.summary_json or '{}')
+        return self._summary_cache
     
     @summary.setter
     def summary(self, value):
-        """Store the summary dictionary as JSON."""
-        self.summary_json = json.dumps(value)
+        """
+        Store the summary dictionary as JSON.
+        The value may contain numpy scalars straight from pandas; the cache is
+        filled from the serialized form so it holds plain Python types (NaN
+        becomes None) exactly as a later reload would.
+        """
+        serialized = orjson.dumps(value, option=SUMMARY_JSON_OPTIONS)
+        self._summary_cache = orjson.loads(serialized)
+        self.summary_json = serialized.decode()
+    
+    def refresh_from_db(self, *args, **kwargs):
+        """Drop the cached summary so it is re-parsed from the reloaded JSON."""
+        self.__dict__.pop('_summary_cache', None)
+        super().refresh_from_db(*args, **kwargs)
     
     def save(self, *args, **kwargs):
         """
         Override save to enforce the 5-dataset limit per user.
-        After saving, delete older datasets beyond the limit.
+        After saving, delete older datasets beyond the limit with a single
+        bulk delete rather than one delete per stale dataset.
         """
         super().save(*args, **kwargs)
         
         # Keep only the last 5 datasets for this user
-        user_datasets = Dataset.objects.filter(user=self.user).order_by('-uploaded_at')
-        datasets_to_delete = user_datasets[5:]  # Get all beyond first 5
+        stale_ids = list(
+            Dataset.objects.filter(user=self.user)
+            .order_by('-uploaded_at')
+            .values_list('id', flat=True)[5:]  # Get all beyond first 5
+        )
         
-        # Delete old datasets and their associated equipment records
-        for old_dataset in datasets_to_delete:
-            old_dataset.delete()
+        # Delete old datasets and their associated equipment records in one go
+        if stale_ids:
+            Dataset.objects.filter(pk__in=stale_ids).delete()
 
 
 class Equipment(models.Model):
@@ -81,6 +105,8 @@ class Equipment(models.Model):
     class Meta:
         # Order alphabetically by name within a dataset
         ordering = ['name']
+        # Serves fetching a dataset's equipment already in display order
+        indexes = [models.Index(fields=['dataset', 'name'])]
     
     def __str__(self):
         return f"{self.name} ({self.equipment_type})"
@@ -25,7 +25,8 @@ class DatasetListSerializer(serializers.ModelSerializer):
     """
     # Parse the JSON summary and include it in the response
     summary = serializers.SerializerMethodField()
-    equipment_count = serializers.SerializerMethodField()
+    # Provided by the queryset annotation in DatasetListView
+    equipment_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Dataset
@@ -34,10 +35,6 @@ class DatasetListSerializer(serializers.ModelSerializer):
     def get_summary(self, obj):
         """Return the parsed summary dictionary."""
         return obj.summary
-    
-    def get_equipment_count(self, obj):
-        """Return total number of equipment records in this dataset."""
-        return obj.equipment.count()
 
 
 class DatasetDetailSerializer(serializers.ModelSerializer):
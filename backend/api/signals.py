@@ -0,0 +1,49 @@
+"""
+Signal handlers for the Chemical Equipment API.
+Keeps the cached per-user dataset list in sync with Dataset changes.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Dataset
+
+
+def _dataset_list_version_key(user_id):
+    """Return the cache key holding a user's dataset list version."""
+    return f'dataset-list-version-u{user_id}'
+
+
+def dataset_list_cache_key(user_id):
+    """
+    Return the cache key holding a user's serialized dataset list.
+    The key embeds the user's current list version, so a list built from a
+    read that raced an upload is stored under a version nobody reads again.
+    Look the key up before querying the database.
+    """
+    # Seeded from the clock so a version lost to eviction never reuses an old number
+    version = cache.get_or_set(_dataset_list_version_key(user_id), time.time_ns, None)
+    return f'dataset-list-u{user_id}-v{version}'
+
+
+def _bump_dataset_list_version(user_id):
+    """Move the user's dataset list to a new version."""
+    key = _dataset_list_version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)  # No version yet (or evicted)
+
+
+@receiver([post_save, post_delete], sender=Dataset)
+def invalidate_dataset_list(sender, instance, **kwargs):
+    """
+    Retire the user's cached dataset list when one of their datasets changes.
+    Deferred until commit so a list request cannot re-cache the list while
+    the upload's equipment rows are still being written.
+    """
+    user_id = instance.user_id
+    transaction.on_commit(lambda: _bump_dataset_list_version(user_id))
@@ -0,0 +1,102 @@
+"""
+Tests for the Chemical Equipment API.
+"""
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Dataset
+from .signals import dataset_list_cache_key
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent.parent / 'sample_equipment_data.csv'
+
+
+class CSVUploadSummaryTests(APITestCase):
+    """
+    The csv-module path for small uploads must produce exactly the same
+    summary and rows as the pandas path used for larger files.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='tester12345')
+        self.client.force_authenticate(user=self.user)
+
+    def upload(self, content, small):
+        """Upload content through the small-file or the pandas path."""
+        # A zero threshold sends every upload through pandas
+        threshold = 100 * 1024 if small else 0
+        with mock.patch('api.views.SMALL_CSV_MAX_BYTES', threshold):
+            return self.client.post(
+                '/api/upload/',
+                {'file': SimpleUploadedFile('data.csv', content, content_type='text/csv')},
+                format='multipart'
+            )
+
+    def assert_paths_match(self, content):
+        small = self.upload(content, small=True)
+        large = self.upload(content, small=False)
+        self.assertEqual(small.status_code, status.HTTP_201_CREATED, small.data)
+        self.assertEqual(large.status_code, status.HTTP_201_CREATED, large.data)
+        self.assertEqual(small.data['summary'], large.data['summary'])
+
+        # Row values only; ids differ between the two datasets
+        def rows(response):
+            return [{k: v for k, v in eq.items() if k != 'id'} for eq in response.data['equipment']]
+        self.assertEqual(rows(small), rows(large))
+        return small.data['summary']
+
+    def test_sample_csv(self):
+        summary = self.assert_paths_match(SAMPLE_CSV.read_bytes())
+        self.assertEqual(summary['total_count'], 15)
+
+    def test_utf8_bom(self):
+        summary = self.assert_paths_match(b'\xef\xbb\xbf' + SAMPLE_CSV.read_bytes())
+        self.assertEqual(summary['total_count'], 15)
+
+    def test_header_only(self):
+        summary = self.assert_paths_match(b'Equipment Name,Type,Flowrate,Pressure,Temperature\n')
+        self.assertEqual(summary['total_count'], 0)
+        self.assertEqual(summary['avg_by_type'], {'Flowrate': {}, 'Pressure': {}, 'Temperature': {}})
+
+    def test_rounding_boundary(self):
+        # Flowrate averages to 153.975, which pandas rounds up and round(x, 2) down
+        content = (
+            b'Equipment Name,Type,Flowrate,Pressure,Temperature\n'
+            b'P1,Pump,430.5,5.0,100\n'
+            b'P2,Pump,7.3,5.0,100\n'
+            b'P3,Pump,84.1,5.0,100\n'
+            b'P4,Pump,94.0,5.0,100\n'
+        )
+        summary = self.assert_paths_match(content)
+        self.assertEqual(summary['avg_flowrate'], 153.98)
+        self.assertEqual(summary['avg_by_type']['Flowrate'], {'Pump': 153.98})
+
+    def test_blank_name(self):
+        content = SAMPLE_CSV.read_bytes() + b',Pump,100,5.0,100\n'
+        self.assert_paths_match(content)
+
+        # Only the two uploads above were saved
+        self.assertEqual(Dataset.objects.filter(user=self.user).count(), 2)
+
+
+class DatasetListCacheTests(APITestCase):
+    """The cached dataset list must never outlive a committed upload."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='tester12345')
+        self.client.force_authenticate(user=self.user)
+
+    def test_late_cache_write_is_not_served(self):
+        # A list request takes its key, then an upload commits before it caches
+        stale_key = dataset_list_cache_key(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            Dataset.objects.create(user=self.user, filename='new.csv', summary={})
+        cache.set(stale_key, b'[]', 300)
+
+        response = self.client.get('/api/datasets/')
+        self.assertEqual([d['filename'] for d in response.json()], ['new.csv'])
@@ -2,14 +2,20 @@
 Views for the Chemical Equipment API.
 Handles CSV upload, data analysis, PDF generation, and authentication.
 """
+import csv
 import io
 import json
 import logging
+from collections import Counter
 from datetime import datetime
 
 import numpy as np
+import orjson
 import pandas as pd
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.http import FileResponse, HttpResponse
+from django.db import transaction
+from django.db.models import Count
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework import status, generics
@@ -22,26 +28,260 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib.enums import TA_CENTER
 
-def _to_native(obj):
-    """Convert numpy scalar types to native Python for JSON serialization."""
-    if isinstance(obj, dict):
-        return {_to_native(k): _to_native(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_to_native(x) for x in obj]
-    if isinstance(obj, (np.integer, np.int64, np.int32)):
-        return int(obj)
-    if isinstance(obj, (np.floating, np.float64, np.float32)):
-        val = float(obj)
-        return None if np.isnan(val) else val
-    return obj
+REQUIRED_COLUMNS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+
+# Free-text CSV columns
+TEXT_COLUMNS = ['Equipment Name', 'Type']
+
+# Numeric CSV columns, in the order both summarizers report them
+NUMERIC_COLUMNS = ['Flowrate', 'Pressure', 'Temperature']
+
+# Explicit dtypes for the numeric CSV columns so the parser skips type inference
+NUMERIC_COLUMN_DTYPES = {column: 'float64' for column in NUMERIC_COLUMNS}
+
+# Uploads below this size are summarized with the csv module instead of pandas,
+# whose fixed DataFrame setup cost dominates for small files
+SMALL_CSV_MAX_BYTES = 100 * 1024
+
+
+# PDF report styles - built once at import rather than on every report request
+_PDF_STYLES = getSampleStyleSheet()
+_PDF_NORMAL_STYLE = _PDF_STYLES['Normal']
+_PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_PDF_STYLES['Heading1'],
+    fontSize=20,
+    alignment=TA_CENTER,
+    spaceAfter=30,
+    textColor=colors.HexColor('#1a56db')  # Blue theme color
+)
+_PDF_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_PDF_STYLES['Heading2'],
+    fontSize=14,
+    spaceAfter=12,
+    textColor=colors.HexColor('#1e40af')
+)
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f7ff')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#93c5fd')),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+])
+_TYPE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecfdf5')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#6ee7b7')),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+])
+# The equipment table also needs per-report alternating row backgrounds,
+# so its static commands are kept in list form
+_EQ_TABLE_STYLE_COMMANDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#7c3aed')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f3ff')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#c4b5fd')),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+]
+
+
+def _compute_summary(df):
+    """Compute the summary statistics stored with a dataset from its DataFrame."""
+    # A single .agg call fuses the mean/min/max reductions per column
+    stats = df[NUMERIC_COLUMNS].agg(['mean', 'min', 'max']).round(2)
+    summary = {
+        'total_count': len(df),
+        'avg_flowrate': stats.at['mean', 'Flowrate'],
+        'avg_pressure': stats.at['mean', 'Pressure'],
+        'avg_temperature': stats.at['mean', 'Temperature'],
+        # Group by Type and count occurrences
+        'type_distribution': df['Type'].value_counts().to_dict(),
+        # Additional stats for richer visualization
+        'min_flowrate': stats.at['min', 'Flowrate'],
+        'max_flowrate': stats.at['max', 'Flowrate'],
+        'min_pressure': stats.at['min', 'Pressure'],
+        'max_pressure': stats.at['max', 'Pressure'],
+        'min_temperature': stats.at['min', 'Temperature'],
+        'max_temperature': stats.at['max', 'Temperature'],
+        # Averages by type for detailed charts (sort=False skips the group-key sort)
+        'avg_by_type': df.groupby('Type', sort=False)[NUMERIC_COLUMNS].mean().round(2).to_dict()
+    }
+    return summary
+
+
+def _summarize_csv_rows(reader, header):
+    """
+    Compute the same summary as _compute_summary in a single pass, without pandas.
+    Used for small uploads; returns the summary along with the parsed
+    (name, type, flowrate, pressure, temperature) rows for bulk insertion.
+    """
+    positions = [header.index(col) for col in REQUIRED_COLUMNS]
+    rows = []
+    type_counts = Counter()
+    # Per-type [totals, compensations], summed the way pandas' groupby mean does
+    # (Kahan compensated summation) so both paths agree to the last bit
+    type_sums = {}
+    
+    for record in reader:
+        if not record:
+            continue  # Blank line, skipped like pandas does
+        name, eq_type, flowrate, pressure, temperature = (record[i] for i in positions)
+        values = (float(flowrate), float(pressure), float(temperature))
+        rows.append((name, eq_type, *values))
+        
+        type_counts[eq_type] += 1
+        totals, compensations = type_sums.setdefault(eq_type, ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]))
+        for i, value in enumerate(values):
+            y = value - compensations[i]
+            t = totals[i] + y
+            compensations[i] = t - totals[i] - y
+            totals[i] = t
+    
+    # Transpose once so each numeric column can be reduced as a whole
+    count = len(rows)
+    columns = dict(zip(NUMERIC_COLUMNS, list(zip(*rows))[2:]))
+    
+    def round2(value):
+        # Same as pandas' .round(2), i.e. numpy's rint(value * 100) / 100;
+        # round(value, 2) rounds the exact binary value and can differ by 0.01
+        return round(value * 100) / 100
+    
+    def column_stat(reduce, column):
+        return round2(reduce(columns[column])) if count else None
+    
+    def mean(values):
+        # numpy's pairwise sum, as pandas uses for a column mean
+        return float(np.array(values).sum()) / len(values)
+    
+    summary = {
+        'total_count': count,
+        'avg_flowrate': column_stat(mean, 'Flowrate'),
+        'avg_pressure': column_stat(mean, 'Pressure'),
+        'avg_temperature': column_stat(mean, 'Temperature'),
+        'type_distribution': dict(type_counts.most_common()),
+        'min_flowrate': column_stat(min, 'Flowrate'),
+        'max_flowrate': column_stat(max, 'Flowrate'),
+        'min_pressure': column_stat(min, 'Pressure'),
+        'max_pressure': column_stat(max, 'Pressure'),
+        'min_temperature': column_stat(min, 'Temperature'),
+        'max_temperature': column_stat(max, 'Temperature'),
+        'avg_by_type': {
+            column: {
+                eq_type: round2(totals[i] / type_counts[eq_type])
+                for eq_type, (totals, _) in type_sums.items()
+            }
+            for i, column in enumerate(NUMERIC_COLUMNS)
+        }
+    }
+    return summary, rows
+
+
+def _build_pdf_report(dataset):
+    """
+    Render the PDF report for a dataset into an in-memory buffer.
+    Kept separate from the view so the build can be handed to a background
+    worker without changes if report generation is moved off the request.
+    """
+    # Create PDF in memory
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    
+    # Container for PDF elements
+    elements = []
+    
+    # Title
+    elements.append(Paragraph("Chemical Equipment Parameter Report", _PDF_TITLE_STYLE))
+    elements.append(Paragraph(f"ChemEquipViz - Generated Report", _PDF_NORMAL_STYLE))
+    elements.append(Spacer(1, 20))
+    
+    # Dataset Info
+    elements.append(Paragraph("Dataset Information", _PDF_HEADING_STYLE))
+    elements.append(Paragraph(f"<b>Filename:</b> {dataset.filename}", _PDF_NORMAL_STYLE))
+    elements.append(Paragraph(f"<b>Uploaded:</b> {dataset.uploaded_at.strftime('%Y-%m-%d %H:%M:%S')}", _PDF_NORMAL_STYLE))
+    elements.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", _PDF_NORMAL_STYLE))
+    elements.append(Spacer(1, 20))
+    
+    # Summary Statistics
+    summary = dataset.summary
+    elements.append(Paragraph("Summary Statistics", _PDF_HEADING_STYLE))
+    
+    summary_data = [
+        ['Metric', 'Value'],
+        ['Total Equipment Count', str(summary.get('total_count', 'N/A'))],
+        ['Average Flowrate', f"{summary.get('avg_flowrate', 'N/A')}"],
+        ['Average Pressure', f"{summary.get('avg_pressure', 'N/A')}"],
+        ['Average Temperature', f"{summary.get('avg_temperature', 'N/A')}"],
+    ]
+    
+    summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
+    elements.append(summary_table)
+    elements.append(Spacer(1, 20))
+    
+    # Type Distribution
+    elements.append(Paragraph("Equipment Type Distribution", _PDF_HEADING_STYLE))
+    type_dist = summary.get('type_distribution', {})
+    type_data = [['Equipment Type', 'Count']]
+    for eq_type, count in type_dist.items():
+        type_data.append([eq_type, str(count)])
+    
+    type_table = Table(type_data, colWidths=[3*inch, 2*inch])
+    type_table.setStyle(_TYPE_TABLE_STYLE)
+    elements.append(type_table)
+    elements.append(Spacer(1, 20))
+    
+    # Equipment Data Table
+    elements.append(Paragraph("Equipment Details", _PDF_HEADING_STYLE))
+    # Stream plain tuples from the cursor instead of instantiating Equipment models
+    equipment_rows = dataset.equipment.values_list(
+        'name', 'equipment_type', 'flowrate', 'pressure', 'temperature'
+    ).iterator(chunk_size=1000)
+    
+    eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
+    eq_data.extend(
+        [name, equipment_type, str(flowrate), str(pressure), str(temperature)]
+        for name, equipment_type, flowrate, pressure, temperature in equipment_rows
+    )
+    
+    # LongTable lays out multi-page tables in a single pass; repeat the header on each page
+    eq_table = LongTable(eq_data, colWidths=[1.5*inch, 1.3*inch, 1*inch, 1*inch, 1.1*inch], repeatRows=1)
+    eq_table.setStyle(TableStyle([
+        *_EQ_TABLE_STYLE_COMMANDS,
+        # Alternate row colors
+        *[('BACKGROUND', (0, i), (-1, i), colors.white) for i in range(2, len(eq_data), 2)]
+    ]))
+    elements.append(eq_table)
+    
+    # Build PDF
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
 
 
 from .models import Dataset, Equipment
+from .signals import dataset_list_cache_key
 from .serializers import (
-    DatasetListSerializer, DatasetDetailSerializer,
+    DatasetListSerializer, DatasetDetailSerializer, EquipmentSerializer,
     UserSerializer, RegisterSerializer, LoginSerializer
 )
 
@@ -124,7 +364,7 @@ class CSVUploadView(APIView):
     """
     POST /api/upload/
     Upload a CSV file, parse it, compute statistics, and store in database.
-    Returns the computed summary and dataset ID.
+    Returns the computed summary, dataset ID, and equipment records.
     Requires authentication.
     """
     permission_classes = [IsAuthenticated]
@@ -145,75 +385,85 @@ class CSVUploadView(APIView):
                 'error': 'Invalid file type. Please upload a CSV file.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        if csv_file.size == 0:
+            return Response({
+                'error': 'The CSV file is empty'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
         try:
-            # Read CSV using pandas - it handles the parsing automatically
-            # Decode the uploaded file bytes to string for pandas
-            df = pd.read_csv(io.StringIO(csv_file.read().decode('utf-8')))
+            df = None
+            if csv_file.size < SMALL_CSV_MAX_BYTES:
+                # Small files are parsed with the csv module, skipping pandas entirely.
+                # utf-8-sig drops the BOM Excel writes, as pandas does on the other path
+                reader = csv.reader(io.StringIO(csv_file.read().decode('utf-8-sig'), newline=''))
+                columns = next(reader, [])
+            else:
+                # Read CSV using pandas' pyarrow engine straight from the uploaded file,
+                # skipping the intermediate decoded string and numeric type inference
+                df = pd.read_csv(csv_file, engine='pyarrow', dtype=NUMERIC_COLUMN_DTYPES)
+                columns = df.columns
             
             # Validate required columns exist
-            required_columns = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in columns]
             
             if missing_columns:
                 return Response({
                     'error': f'Missing required columns: {", ".join(missing_columns)}'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # Compute summary statistics using pandas
-            summary = {
-                'total_count': len(df),
-                'avg_flowrate': round(df['Flowrate'].mean(), 2),
-                'avg_pressure': round(df['Pressure'].mean(), 2),
-                'avg_temperature': round(df['Temperature'].mean(), 2),
-                # Group by Type and count occurrences
-                'type_distribution': df['Type'].value_counts().to_dict(),
-                # Additional stats for richer visualization
-                'min_flowrate': round(df['Flowrate'].min(), 2),
-                'max_flowrate': round(df['Flowrate'].max(), 2),
-                'min_pressure': round(df['Pressure'].min(), 2),
-                'max_pressure': round(df['Pressure'].max(), 2),
-                'min_temperature': round(df['Temperature'].min(), 2),
-                'max_temperature': round(df['Temperature'].max(), 2),
-                # Averages by type for detailed charts
-                'avg_by_type': df.groupby('Type').agg({
-                    'Flowrate': 'mean',
-                    'Pressure': 'mean',
-                    'Temperature': 'mean'
-                }).round(2).to_dict()
-            }
-            
-            # Convert numpy types to native Python so summary is JSON-serializable
-            summary = _to_native(summary)
-
-            # Create the dataset record
-            dataset = Dataset.objects.create(
-                user=request.user,
-                filename=csv_file.name,
-            )
-            dataset.summary = summary  # This uses the property setter
-            dataset.save()
-            
-            # Create equipment records for each row in the CSV
-            equipment_objects = []
-            for _, row in df.iterrows():
-                equipment_objects.append(Equipment(
-                    dataset=dataset,
-                    name=row['Equipment Name'],
-                    equipment_type=row['Type'],
-                    flowrate=row['Flowrate'],
-                    pressure=row['Pressure'],
-                    temperature=row['Temperature']
-                ))
+            if df is None:
+                summary, rows = _summarize_csv_rows(reader, columns)
+            else:
+                # Blank text cells come back as NaN; read them as '' like the csv path
+                df[TEXT_COLUMNS] = df[TEXT_COLUMNS].fillna('')
+                # Compute summary statistics using pandas
+                summary = _compute_summary(df)
+                # itertuples yields plain tuples, avoiding the per-row Series boxing of iterrows
+                rows = df[REQUIRED_COLUMNS].itertuples(index=False, name=None)
             
-            # Bulk create for efficiency
-            Equipment.objects.bulk_create(equipment_objects)
+            # Write the dataset, trim old ones, and insert equipment in one transaction
+            # so the upload commits once and never leaves a dataset without its rows
+            with transaction.atomic():
+                # Create the dataset record with its summary in a single INSERT
+                dataset = Dataset.objects.create(
+                    user=request.user,
+                    filename=csv_file.name,
+                    summary=summary,  # This uses the property setter
+                )
+                
+                # Create equipment records for each row in the CSV. Text fields are
+                # coerced to str as the database will store them, since pandas types
+                # an all-numeric column (e.g. names like 101, 102) as numbers
+                equipment_objects = [
+                    Equipment(
+                        dataset=dataset,
+                        name=str(name),
+                        equipment_type=str(equipment_type),
+                        flowrate=flowrate,
+                        pressure=pressure,
+                        temperature=temperature
+                    )
+                    for name, equipment_type, flowrate, pressure, temperature in rows
+                ]
+                
+                # Bulk create for efficiency, chunking large uploads into batches
+                Equipment.objects.bulk_create(equipment_objects, batch_size=1000)
+                
+                # Built inside the transaction so a failure here rolls the upload
+                # back instead of reporting an error for a dataset that was saved
+                payload = {
+                    'message': 'CSV uploaded and processed successfully',
+                    'dataset_id': dataset.id,
+                    'filename': csv_file.name,
+                    'summary': dataset.summary,  # JSON-native form of the stored summary
+                    # Include the rows (in the detail endpoint's name order) so clients
+                    # don't need a second round trip to /datasets/<id>/
+                    'equipment': EquipmentSerializer(
+                        sorted(equipment_objects, key=lambda eq: eq.name), many=True
+                    ).data
+                }
             
-            return Response({
-                'message': 'CSV uploaded and processed successfully',
-                'dataset_id': dataset.id,
-                'filename': csv_file.name,
-                'summary': summary
-            }, status=status.HTTP_201_CREATED)
+            return Response(payload, status=status.HTTP_201_CREATED)
             
         except pd.errors.EmptyDataError:
             return Response({
@@ -236,9 +486,36 @@ class DatasetListView(generics.ListAPIView):
     serializer_class = DatasetListSerializer
     permission_classes = [IsAuthenticated]
     
+    # Seconds a cached list stays valid; signal handlers invalidate it on change
+    cache_timeout = 300
+    
+    def list(self, request, *args, **kwargs):
+        # Serve the already-serialized JSON from the cache when available,
+        # skipping the query, summary parsing, and rendering entirely.
+        # The versioned key is taken before the query, so if an upload commits
+        # meanwhile this (possibly stale) list lands under a retired version
+        cache_key = dataset_list_cache_key(request.user.id)
+        content = cache.get(cache_key)
+        
+        if content is None:
+            serializer = self.get_serializer(self.get_queryset(), many=True)
+            content = orjson.dumps(serializer.data)
+            cache.set(cache_key, content, self.cache_timeout)
+        
+        return HttpResponse(content, content_type='application/json')
+    
     def get_queryset(self):
         # Only return datasets belonging to the current user
-        return Dataset.objects.filter(user=self.request.user)
+        # Load just the serialized columns and annotate the equipment count
+        # so everything is fetched in a single query
+        return (
+            Dataset.objects
+            .filter(user=self.request.user)
+            .only('id', 'filename', 'uploaded_at', 'summary_json')
+            .annotate(equipment_count=Count('equipment'))
+            # Meta.ordering is not applied to GROUP BY queries, so order explicitly
+            .order_by('-uploaded_at')
+        )
 
 
 class DatasetDetailView(generics.RetrieveAPIView):
@@ -252,7 +529,8 @@ class DatasetDetailView(generics.RetrieveAPIView):
     
     def get_queryset(self):
         # Only allow access to user's own datasets
-        return Dataset.objects.filter(user=self.request.user)
+        # Prefetch equipment so the nested serializer loads it in one query
+        return Dataset.objects.filter(user=self.request.user).prefetch_related('equipment')
 
 
 class GeneratePDFReportView(APIView):
@@ -273,132 +551,10 @@ class GeneratePDFReportView(APIView):
                 'error': 'Dataset not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        
-        # Container for PDF elements
-        elements = []
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=20,
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1a56db')  # Blue theme color
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            textColor=colors.HexColor('#1e40af')
+        # Stream the buffer rather than copying it with getvalue()
+        return FileResponse(
+            _build_pdf_report(dataset),
+            content_type='application/pdf',
+            as_attachment=True,
+            filename=f'report_{dataset.filename}_{dataset.id}.pdf'
         )
-        normal_style = styles['Normal']
-        
-        # Title
-        elements.append(Paragraph("Chemical Equipment Parameter Report", title_style))
-        elements.append(Paragraph(f"ChemEquipViz - Generated Report", styles['Normal']))
-        elements.append(Spacer(1, 20))
-        
-        # Dataset Info
-        elements.append(Paragraph("Dataset Information", heading_style))
-        elements.append(Paragraph(f"<b>Filename:</b> {dataset.filename}", normal_style))
-        elements.append(Paragraph(f"<b>Uploaded:</b> {dataset.uploaded_at.strftime('%Y-%m-%d %H:%M:%S')}", normal_style))
-        elements.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", normal_style))
-        elements.append(Spacer(1, 20))
-        
-        # Summary Statistics
-        summary = dataset.summary
-        elements.append(Paragraph("Summary Statistics", heading_style))
-        
-        summary_data = [
-            ['Metric', 'Value'],
-            ['Total Equipment Count', str(summary.get('total_count', 'N/A'))],
-            ['Average Flowrate', f"{summary.get('avg_flowrate', 'N/A')}"],
-            ['Average Pressure', f"{summary.get('avg_pressure', 'N/A')}"],
-            ['Average Temperature', f"{summary.get('avg_temperature', 'N/A')}"],
-        ]
-        
-        summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f7ff')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#93c5fd')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
-        elements.append(summary_table)
-        elements.append(Spacer(1, 20))
-        
-        # Type Distribution
-        elements.append(Paragraph("Equipment Type Distribution", heading_style))
-        type_dist = summary.get('type_distribution', {})
-        type_data = [['Equipment Type', 'Count']]
-        for eq_type, count in type_dist.items():
-            type_data.append([eq_type, str(count)])
-        
-        type_table = Table(type_data, colWidths=[3*inch, 2*inch])
-        type_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecfdf5')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#6ee7b7')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
-        elements.append(type_table)
-        elements.append(Spacer(1, 20))
-        
-        # Equipment Data Table
-        elements.append(Paragraph("Equipment Details", heading_style))
-        equipment_list = dataset.equipment.all()
-        
-        eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
-        for eq in equipment_list:
-            eq_data.append([
-                eq.name,
-                eq.equipment_type,
-                str(eq.flowrate),
-                str(eq.pressure),
-                str(eq.temperature)
-            ])
-        
-        eq_table = Table(eq_data, colWidths=[1.5*inch, 1.3*inch, 1*inch, 1*inch, 1.1*inch])
-        eq_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#7c3aed')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f3ff')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#c4b5fd')),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('PADDING', (0, 0), (-1, -1), 6),
-            # Alternate row colors
-            *[('BACKGROUND', (0, i), (-1, i), colors.white) for i in range(2, len(eq_data), 2)]
-        ]))
-        elements.append(eq_table)
-        
-        # Build PDF
-        doc.build(elements)
-        
-        # Prepare response
-        buffer.seek(0)
-        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="report_{dataset.filename}_{dataset.id}.pdf"'
-        
-        return response
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # Must be at top
+    'django.middleware.gzip.GZipMiddleware',  # Compress JSON responses for clients that accept gzip
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -103,6 +104,15 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache - holds the serialized per-user dataset lists.
+# Local memory is per-process; use a shared backend (Redis/Memcached) when
+# running multiple workers so invalidation reaches every process.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 # CORS settings - Allow all origins for development
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
@@ -18,32 +18,75 @@ The application uses:
 
 import sys
 import os
+import functools
 import json
+import threading
+import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 from datetime import datetime
 
+# ciso8601 is an optional C parser for the API's ISO timestamps
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        parse_datetime = datetime.fromisoformat  # accepts a trailing 'Z'
+    else:
+        def parse_datetime(value):
+            """Parse an ISO 8601 timestamp, including a trailing 'Z'."""
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 # PyQt5 imports for GUI components
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView,
     QFileDialog, QMessageBox, QStackedWidget, QFrame, QGridLayout,
-    QHeaderView, QSplitter, QGroupBox, QScrollArea, QSizePolicy
+    QHeaderView, QSplitter, QGroupBox, QScrollArea, QSizePolicy, QStyle
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot,
+    QAbstractTableModel, QModelIndex, QVariant
+)
+from PyQt5.QtGui import (
+    QFont, QColor, QPalette, QIcon, QBrush, QGradient, QLinearGradient
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
 
-# Matplotlib imports for charts
-import matplotlib
-matplotlib.use('Qt5Agg')  # Use Qt5 backend for matplotlib
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+# Matplotlib is imported lazily by MatplotlibCanvas so the login window
+# can paint before the plotting libraries are loaded
 
 # ========== Configuration ==========
 
 # API base URL - same backend as the web frontend
 API_BASE_URL = "http://localhost:8000/api"
 
+# Endpoint URLs, built once from the base URL
+_URL_REGISTER = f"{API_BASE_URL}/auth/register/"
+_URL_LOGIN = f"{API_BASE_URL}/auth/login/"
+_URL_LOGOUT = f"{API_BASE_URL}/auth/logout/"
+_URL_UPLOAD = f"{API_BASE_URL}/upload/"
+_URL_DATASETS = f"{API_BASE_URL}/datasets/"
+_URL_DATASET_DETAIL_FMT = API_BASE_URL + "/datasets/{}/"
+_URL_DATASET_REPORT_FMT = API_BASE_URL + "/datasets/{}/report/"
+
+# Upper bound on HTTP requests in flight at once; sizes both the connection
+# pool and the worker thread pool so concurrent requests overlap
+MAX_CONCURRENT_REQUESTS = 10
+
+# How long (seconds) GET responses are served from the in-process cache
+CACHE_TTL_SECONDS = 30
+
+# Request bodies are pre-serialized with orjson, so the type is set by hand
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# (connect, read) timeouts in seconds so a stalled server can't hold a worker forever
+DEFAULT_TIMEOUT = (3.05, 30)
+UPLOAD_TIMEOUT = (3.05, 300)
+DOWNLOAD_TIMEOUT = (3.05, 120)
+
 # Color theme (Blue - Version A)
 COLORS = {
     'primary': '#2563eb',
@@ -62,6 +105,150 @@ COLORS = {
 }
 
 
+# ========== Stylesheets ==========
+# Built once at import time; widgets pick a finished string instead of
+# re-formatting the same QSS on every construction
+
+def _button_qss(bg, hover, text):
+    """Build the QSS for a StyledButton color variant."""
+    return f"""
+            QPushButton {{
+                background-color: {bg};
+                color: {text};
+                border: none;
+                border-radius: 6px;
+                padding: 8px 16px;
+                font-weight: bold;
+                font-size: 14px;
+            }}
+            QPushButton:hover {{
+                background-color: {hover};
+            }}
+            QPushButton:disabled {{
+                background-color: {COLORS['gray_200']};
+                color: {COLORS['gray_500']};
+            }}
+        """
+
+
+_BUTTON_QSS = {
+    name: _button_qss(bg, hover, text)
+    for name, (bg, hover, text) in {
+        'primary': (COLORS['primary'], COLORS['primary_dark'], 'white'),
+        'success': (COLORS['success'], '#059669', 'white'),
+        'danger': (COLORS['error'], '#dc2626', 'white'),
+        'secondary': (COLORS['gray_200'], COLORS['gray_200'], COLORS['gray_700']),
+    }.items()
+}
+
+_INPUT_QSS = f"""
+            QLineEdit {{
+                padding: 12px;
+                font-size: 14px;
+                border: 1px solid {COLORS['gray_200']};
+                border-radius: 6px;
+                background: {COLORS['white']};
+            }}
+            QLineEdit:focus {{
+                border: 2px solid {COLORS['primary']};
+            }}
+        """
+
+_STAT_CARD_VALUE_QSS = f"""
+            font-size: 28px;
+            font-weight: bold;
+            color: {COLORS['gray_800']};
+        """
+
+_STAT_CARD_TITLE_QSS = f"""
+            font-size: 12px;
+            color: {COLORS['gray_500']};
+            text-transform: uppercase;
+        """
+
+# Stat card frames only differ by accent color, so one string per color
+_STAT_CARD_QSS = {}
+
+
+def _stat_card_qss(color):
+    """Return the (cached) frame QSS for a stat card accent color."""
+    qss = _STAT_CARD_QSS.get(color)
+    if qss is None:
+        qss = _STAT_CARD_QSS[color] = f"""
+            QFrame {{
+                background-color: {COLORS['white']};
+                border-radius: 8px;
+                border-left: 4px solid {color};
+            }}
+        """
+    return qss
+
+
+# Dashboard upload status line, restyled on every upload
+_STATUS_QSS = {
+    'pending': "color: {gray_500};".format_map(COLORS),
+    'success': "color: {success}; font-weight: bold;".format_map(COLORS),
+    'error': "color: {error}; font-weight: bold;".format_map(COLORS),
+}
+
+# History page message shown in place of the rows
+_EMPTY_MESSAGE_QSS = "color: {gray_500}; padding: 40px;".format_map(COLORS)
+_ERROR_MESSAGE_QSS = "color: {error}; padding: 20px;".format_map(COLORS)
+
+# Application-wide stylesheet, parsed once by QApplication. Widgets opt in
+# through their object names instead of each calling setStyleSheet
+GLOBAL_QSS = f"""
+    QMainWindow {{
+        background-color: {COLORS['gray_50']};
+    }}
+    
+    QLabel#navTitle {{
+        color: white;
+        font-size: 20px;
+        font-weight: bold;
+    }}
+    QLabel#navUser {{
+        color: #bfdbfe;
+    }}
+    QPushButton#navBtn {{
+        background: transparent;
+        color: #bfdbfe;
+        border: none;
+        padding: 8px 16px;
+        font-size: 14px;
+    }}
+    QPushButton#navBtn:hover {{
+        background: rgba(255, 255, 255, 0.1);
+        color: white;
+        border-radius: 4px;
+    }}
+    
+    QFrame#historyItem {{
+        background-color: {COLORS['white']};
+        border-radius: 8px;
+    }}
+    QFrame#historyItem:hover {{
+        background-color: {COLORS['gray_50']};
+    }}
+    QLabel#historyFilename {{
+        font-size: 16px;
+        font-weight: bold;
+        color: {COLORS['gray_800']};
+    }}
+    QLabel#metaLabel {{
+        color: {COLORS['gray_500']};
+        font-size: 12px;
+    }}
+    QLabel#statsLabel {{
+        background-color: {COLORS['gray_100']};
+        color: {COLORS['gray_700']};
+        padding: 4px 8px;
+        border-radius: 4px;
+        font-size: 11px;
+    }}
+"""
+
+
 # ========== API Service Class ==========
 
 class APIService:
@@ -73,95 +260,177 @@ class APIService:
     def __init__(self):
         self.token = None
         self.user = None
+        
+        # One session for all calls so keep-alive connections are reused
+        # instead of opening a new connection per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            # Retries apply to idempotent requests (GETs); the final response is
+            # returned rather than raised so raise_for_status reports it as usual
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504], raise_on_status=False),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Ask for compressed responses; requests decompresses them transparently.
+        # 'br' is not advertised since decoding it needs the optional brotli package
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        
+        # Parsed GET responses keyed by URL: {url: (fetched_at, data)}
+        self._cache = {}
+        
+        # Bumped on every login and logout so work started under an earlier
+        # session can tell its results are stale
+        self.generation = 0
+        
+        # Cleared while a logged-out token is being revoked; a new login waits
+        # for it, since the server would otherwise hand back that same token
+        self._revoked = threading.Event()
+        self._revoked.set()
+    
+    def _peek_cached(self, url):
+        """Return the cached response for a URL if still fresh, else None."""
+        hit = self._cache.get(url)
+        if hit and time.monotonic() - hit[0] < CACHE_TTL_SECONDS:
+            return hit[1]
+        return None
+    
+    def _get_cached(self, url, fresh=False):
+        """GET a URL, reusing the parsed response for CACHE_TTL_SECONDS."""
+        if not fresh:
+            data = self._peek_cached(url)
+            if data is not None:
+                return data
+        
+        now = time.monotonic()
+        generation = self.generation
+        
+        response = self.session.get(url, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        # Don't cache a response for a session that ended while it was in flight
+        if generation == self.generation:
+            self._cache[url] = (now, data)
+        return data
     
-    def _headers(self):
-        """Get headers for API requests, including auth token if available."""
-        headers = {'Content-Type': 'application/json'}
-        if self.token:
-            headers['Authorization'] = f'Token {self.token}'
-        return headers
+    def _set_auth(self, data):
+        """Store the auth response and attach the token to the session."""
+        self.generation += 1
+        self._cache.clear()
+        self.token = data['token']
+        self.user = data['user']
+        self.session.headers['Authorization'] = f'Token {self.token}'
     
     def register(self, username, email, password):
         """Register a new user."""
-        response = requests.post(
-            f"{API_BASE_URL}/auth/register/",
-            json={'username': username, 'email': email, 'password': password}
+        self._revoked.wait(DEFAULT_TIMEOUT[1])
+        response = self.session.post(
+            _URL_REGISTER,
+            data=orjson.dumps({'username': username, 'email': email, 'password': password}),
+            headers=JSON_HEADERS,
+            timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
-        self.token = data['token']
-        self.user = data['user']
+        data = orjson.loads(response.content)
+        self._set_auth(data)
         return data
     
     def login(self, username, password):
         """Login an existing user."""
-        response = requests.post(
-            f"{API_BASE_URL}/auth/login/",
-            json={'username': username, 'password': password}
+        self._revoked.wait(DEFAULT_TIMEOUT[1])
+        response = self.session.post(
+            _URL_LOGIN,
+            data=orjson.dumps({'username': username, 'password': password}),
+            headers=JSON_HEADERS,
+            timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
-        self.token = data['token']
-        self.user = data['user']
+        data = orjson.loads(response.content)
+        self._set_auth(data)
         return data
     
     def logout(self):
-        """Logout the current user."""
-        if self.token:
-            try:
-                requests.post(
-                    f"{API_BASE_URL}/auth/logout/",
-                    headers=self._headers()
-                )
-            except:
-                pass  # Ignore errors on logout
+        """
+        Forget the current user locally and return their token.
+        Does no I/O: pass the token to revoke_token() on a worker, which the
+        next login waits for.
+        """
+        token = self.token
+        if token:
+            self._revoked.clear()
+        self.session.headers.pop('Authorization', None)
+        self.generation += 1
+        self._cache.clear()
         self.token = None
         self.user = None
+        return token
+    
+    def revoke_token(self, token):
+        """Invalidate a logged-out token on the server."""
+        try:
+            self.session.post(
+                _URL_LOGOUT,
+                headers={'Authorization': f'Token {token}'},
+                timeout=DEFAULT_TIMEOUT
+            )
+        except:
+            pass  # Ignore errors on logout
+        finally:
+            self._revoked.set()
     
     def upload_csv(self, filepath):
-        """Upload a CSV file to the backend."""
-        headers = {}
-        if self.token:
-            headers['Authorization'] = f'Token {self.token}'
-        
+        """Upload a CSV file to the backend, streaming the multipart body."""
         with open(filepath, 'rb') as f:
-            files = {'file': (os.path.basename(filepath), f, 'text/csv')}
-            response = requests.post(
-                f"{API_BASE_URL}/upload/",
-                files=files,
-                headers=headers
+            encoder = MultipartEncoder(
+                fields={'file': (os.path.basename(filepath), f, 'text/csv')}
+            )
+            response = self.session.post(
+                _URL_UPLOAD,
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=UPLOAD_TIMEOUT
             )
         response.raise_for_status()
-        return response.json()
+        
+        # The dataset list changed; older datasets may also have been trimmed
+        self._cache.clear()
+        return orjson.loads(response.content)
     
-    def get_datasets(self):
+    def get_datasets(self, fresh=False):
         """Get list of datasets."""
-        response = requests.get(
-            f"{API_BASE_URL}/datasets/",
-            headers=self._headers()
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(_URL_DATASETS, fresh=fresh)
+    
+    def cached_datasets(self):
+        """Return the cached dataset list without a request, or None if stale."""
+        return self._peek_cached(_URL_DATASETS)
     
     def get_dataset_detail(self, dataset_id):
         """Get details of a specific dataset."""
-        response = requests.get(
-            f"{API_BASE_URL}/datasets/{dataset_id}/",
-            headers=self._headers()
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(_URL_DATASET_DETAIL_FMT.format(dataset_id))
     
     def download_pdf_report(self, dataset_id, save_path):
-        """Download PDF report for a dataset."""
-        response = requests.get(
-            f"{API_BASE_URL}/datasets/{dataset_id}/report/",
-            headers=self._headers()
-        )
-        response.raise_for_status()
-        
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
+        """Download PDF report for a dataset, streaming it to disk in chunks."""
+        url = _URL_DATASET_REPORT_FMT.format(dataset_id)
+        # Stream into a side file and move it into place once complete, so a
+        # dropped connection never leaves a truncated PDF at save_path
+        part_path = f"{save_path}.part"
+        try:
+            with self.session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+            os.replace(part_path, save_path)
+        except BaseException:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass  # Never created, e.g. the request itself failed
+            raise
         return save_path
 
 
@@ -169,6 +438,54 @@ class APIService:
 api = APIService()
 
 
+# ========== Background Workers ==========
+
+class WorkerSignals(QObject):
+    """Signals used by ApiWorker to report back to the GUI thread."""
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    finished = pyqtSignal()
+
+
+class ApiWorker(QRunnable):
+    """
+    Runs a blocking API call on the global thread pool so the Qt event loop
+    keeps painting while the request is in flight.
+    """
+    
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Call the function and emit its result or the raised exception."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+def _current_session_only(slot):
+    """
+    Wrap a worker slot so it is skipped if the user has logged out (or in
+    again) since the worker was submitted. Wrap at connect time.
+    """
+    generation = api.generation
+    
+    @functools.wraps(slot)
+    def wrapper(*args):
+        if api.generation == generation:
+            slot(*args)
+    return wrapper
+
+
 # ========== Custom Widgets ==========
 
 class StyledButton(QPushButton):
@@ -183,32 +500,7 @@ class StyledButton(QPushButton):
     
     def apply_style(self):
         """Apply color-coded styling."""
-        colors = {
-            'primary': (COLORS['primary'], COLORS['primary_dark'], 'white'),
-            'success': (COLORS['success'], '#059669', 'white'),
-            'danger': (COLORS['error'], '#dc2626', 'white'),
-            'secondary': (COLORS['gray_200'], COLORS['gray_200'], COLORS['gray_700']),
-        }
-        bg, hover, text = colors.get(self.color, colors['primary'])
-        
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg};
-                color: {text};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover};
-            }}
-            QPushButton:disabled {{
-                background-color: {COLORS['gray_200']};
-                color: {COLORS['gray_500']};
-            }}
-        """)
+        self.setStyleSheet(_BUTTON_QSS.get(self.color, _BUTTON_QSS['primary']))
 
 
 class StatCard(QFrame):
@@ -217,47 +509,156 @@ class StatCard(QFrame):
     def __init__(self, title, value, color=COLORS['primary'], parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['white']};
-                border-radius: 8px;
-                border-left: 4px solid {color};
-            }}
-        """)
+        self.setStyleSheet(_stat_card_qss(color))
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
         
         # Value label (large)
         value_label = QLabel(str(value))
-        value_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: bold;
-            color: {COLORS['gray_800']};
-        """)
+        value_label.setStyleSheet(_STAT_CARD_VALUE_QSS)
         layout.addWidget(value_label)
         
         # Title label (small)
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {COLORS['gray_500']};
-            text-transform: uppercase;
-        """)
+        title_label.setStyleSheet(_STAT_CARD_TITLE_QSS)
         layout.addWidget(title_label)
 
 
-class MatplotlibCanvas(FigureCanvas):
+@functools.lru_cache(maxsize=None)
+def _standard_icon(pixmap):
+    """Return a QStyle standard icon, loaded once per process."""
+    return QApplication.style().standardIcon(pixmap)
+
+
+class HistoryRow(QFrame):
+    """
+    One dataset in the history list. Rows are pooled by HistoryPage and
+    re-bound to new data with set_dataset() instead of being rebuilt.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("historyItem")
+        self.dataset = None
+        
+        # One grid per row: icon + filename, meta and stats on the left,
+        # the PDF button spanning all three lines on the right
+        grid = QGridLayout(self)
+        grid.setContentsMargins(16, 12, 16, 12)
+        grid.setHorizontalSpacing(6)
+        
+        # Icons come from the shared style rather than emoji, which would send
+        # every row's text layout through Qt's font-fallback search
+        file_icon = QLabel()
+        file_icon.setPixmap(_standard_icon(QStyle.SP_FileIcon).pixmap(16, 16))
+        file_icon.setFixedSize(16, 16)
+        grid.addWidget(file_icon, 0, 0)
+        
+        self.filename_label = QLabel()
+        self.filename_label.setObjectName("historyFilename")
+        grid.addWidget(self.filename_label, 0, 1)
+        
+        self.meta_label = QLabel()
+        self.meta_label.setObjectName("metaLabel")
+        grid.addWidget(self.meta_label, 1, 0, 1, 3, Qt.AlignLeft)
+        
+        self.stats_label = QLabel()
+        self.stats_label.setObjectName("statsLabel")
+        grid.addWidget(self.stats_label, 2, 0, 1, 3, Qt.AlignLeft)
+        
+        # Action button
+        self.pdf_btn = StyledButton("PDF", 'success')
+        self.pdf_btn.setIcon(_standard_icon(QStyle.SP_ArrowDown))
+        grid.addWidget(self.pdf_btn, 0, 3, 3, 1, Qt.AlignVCenter)
+        
+        grid.setColumnStretch(2, 1)
+    
+    def set_dataset(self, dataset):
+        """Show a dataset in this row."""
+        self.dataset = dataset
+        self.filename_label.setText(dataset['filename'])
+        
+        # Suggested report file name, formatted once per dataset
+        if '_pdf_default_name' not in dataset:
+            dataset['_pdf_default_name'] = f"report_{dataset['filename']}.pdf"
+        
+        # Format date
+        date_str = parse_datetime(dataset['uploaded_at']).strftime('%Y-%m-%d %H:%M')
+        self.meta_label.setText(f"Uploaded: {date_str} • {dataset['equipment_count']} equipment records")
+        
+        # Summary stats
+        summary = dataset.get('summary')
+        if summary:
+            self.stats_label.setText(f"Avg Flow: {summary.get('avg_flowrate', 'N/A')} • Avg Pressure: {summary.get('avg_pressure', 'N/A')} • Avg Temp: {summary.get('avg_temperature', 'N/A')}")
+        self.stats_label.setVisible(bool(summary))
+
+
+class EquipmentTableModel(QAbstractTableModel):
+    """
+    Table model over the equipment list, stored column-wise as display
+    strings so data() is a plain list lookup.
+    """
+    
+    HEADERS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+    KEYS = ['name', 'equipment_type', 'flowrate', 'pressure', 'temperature']
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = [[] for _ in self.KEYS]
+        self._row_count = 0
+    
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset."""
+        self.beginResetModel()
+        # Convert each column to strings once rather than on every paint
+        self._columns = [[str(eq[key]) for eq in rows] for key in self.KEYS]
+        self._row_count = len(rows)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.KEYS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return QVariant()
+        return self._columns[index.column()][index.row()]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+
+class MatplotlibCanvas(QWidget):
     """A Matplotlib canvas widget for embedding charts in PyQt5."""
     
     def __init__(self, parent=None, width=5, height=4, dpi=100):
+        super().__init__(parent)
+        
+        # Matplotlib imports for charts (deferred until the first chart)
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.setParent(parent)
+        self.canvas = FigureCanvas(self.fig)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
         
         # Set figure background
         self.fig.patch.set_facecolor(COLORS['white'])
+    
+    def draw_idle(self):
+        """Schedule a redraw of the figure on the next event loop pass."""
+        self.canvas.draw_idle()
 
 
 # ========== Login Page ==========
@@ -324,13 +725,13 @@ class LoginPage(QWidget):
         # Username field
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
-        self.username_input.setStyleSheet(self._input_style())
+        self.username_input.setStyleSheet(_INPUT_QSS)
         card_layout.addWidget(self.username_input)
         
         # Email field (for registration)
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Email")
-        self.email_input.setStyleSheet(self._input_style())
+        self.email_input.setStyleSheet(_INPUT_QSS)
         self.email_input.hide()
         card_layout.addWidget(self.email_input)
         
@@ -338,7 +739,7 @@ class LoginPage(QWidget):
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setStyleSheet(self._input_style())
+        self.password_input.setStyleSheet(_INPUT_QSS)
         self.password_input.returnPressed.connect(self.handle_submit)
         card_layout.addWidget(self.password_input)
         
@@ -379,21 +780,6 @@ class LoginPage(QWidget):
             }}
         """)
     
-    def _input_style(self):
-        """Return consistent input field styling."""
-        return f"""
-            QLineEdit {{
-                padding: 12px;
-                font-size: 14px;
-                border: 1px solid {COLORS['gray_200']};
-                border-radius: 6px;
-                background: {COLORS['white']};
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {COLORS['primary']};
-            }}
-        """
-    
     def toggle_mode(self):
         """Toggle between login and registration mode."""
         self.is_registering = not self.is_registering
@@ -410,6 +796,10 @@ class LoginPage(QWidget):
     
     def handle_submit(self):
         """Handle form submission."""
+        # Enter in the password field still fires while a submit is in flight
+        if not self.submit_btn.isEnabled():
+            return
+        
         username = self.username_input.text().strip()
         password = self.password_input.text()
         email = self.email_input.text().strip()
@@ -425,15 +815,22 @@ class LoginPage(QWidget):
         self.submit_btn.setEnabled(False)
         self.submit_btn.setText("Please wait...")
         
-        try:
-            if self.is_registering:
-                api.register(username, email, password)
-            else:
-                api.login(username, password)
-            
-            self.on_login_success()
-            
-        except requests.exceptions.HTTPError as e:
+        if self.is_registering:
+            worker = ApiWorker(api.register, username, email, password)
+        else:
+            worker = ApiWorker(api.login, username, password)
+        worker.signals.result.connect(self._on_submit_done)
+        worker.signals.error.connect(self._on_submit_error)
+        worker.signals.finished.connect(self._on_submit_finished)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_submit_done(self, data):
+        """Handle a successful login/registration."""
+        self.on_login_success()
+    
+    def _on_submit_error(self, e):
+        """Show a message for a failed login/registration."""
+        if isinstance(e, requests.exceptions.HTTPError):
             if e.response is not None:
                 try:
                     error_data = e.response.json()
@@ -447,18 +844,29 @@ class LoginPage(QWidget):
                     self.show_error("An error occurred. Please try again.")
             else:
                 self.show_error("Unable to connect to server.")
-        except requests.exceptions.ConnectionError:
+        elif isinstance(e, requests.exceptions.ConnectionError):
             self.show_error("Unable to connect to server. Is the backend running?")
-        except Exception as e:
+        else:
             self.show_error(str(e))
-        finally:
-            self.submit_btn.setEnabled(True)
-            self.submit_btn.setText("Create Account" if self.is_registering else "Sign In")
+    
+    def _on_submit_finished(self):
+        """Restore the submit button once the request completes."""
+        self.submit_btn.setEnabled(True)
+        self.submit_btn.setText("Create Account" if self.is_registering else "Sign In")
     
     def show_error(self, message):
         """Display an error message."""
         self.error_label.setText(message)
         self.error_label.show()
+    
+    def reset(self):
+        """Return the form to its initial sign-in state."""
+        if self.is_registering:
+            self.toggle_mode()
+        self.username_input.clear()
+        self.email_input.clear()
+        self.password_input.clear()
+        self.error_label.hide()
 
 
 # ========== Dashboard Page ==========
@@ -527,10 +935,10 @@ class DashboardPage(QWidget):
         layout.addWidget(upload_card)
         
         # Stats container (hidden until data is uploaded)
+        # The cards live in self.stats_inner, which is replaced as a whole
         self.stats_container = QWidget()
-        stats_layout = QHBoxLayout(self.stats_container)
-        stats_layout.setSpacing(16)
-        stats_layout.setContentsMargins(0, 0, 0, 0)
+        QHBoxLayout(self.stats_container).setContentsMargins(0, 0, 0, 0)
+        self.stats_inner = None
         self.stats_container.hide()
         layout.addWidget(self.stats_container)
         
@@ -539,6 +947,22 @@ class DashboardPage(QWidget):
         charts_layout = QHBoxLayout(self.charts_container)
         charts_layout.setSpacing(16)
         charts_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Chart canvases are created once and re-plotted on each upload
+        self.bar_canvas = MatplotlibCanvas(self, width=6, height=4)
+        bar_frame = QFrame()
+        bar_frame.setStyleSheet(f"background-color: {COLORS['white']}; border-radius: 8px;")
+        bar_layout = QVBoxLayout(bar_frame)
+        bar_layout.addWidget(self.bar_canvas)
+        charts_layout.addWidget(bar_frame)
+        
+        self.pie_canvas = MatplotlibCanvas(self, width=5, height=4)
+        pie_frame = QFrame()
+        pie_frame.setStyleSheet(f"background-color: {COLORS['white']}; border-radius: 8px;")
+        pie_layout = QVBoxLayout(pie_frame)
+        pie_layout.addWidget(self.pie_canvas)
+        charts_layout.addWidget(pie_frame)
+        
         self.charts_container.hide()
         layout.addWidget(self.charts_container)
         
@@ -562,9 +986,12 @@ class DashboardPage(QWidget):
         """)
         table_layout.addWidget(table_header)
         
-        self.data_table = QTableWidget()
+        self.table_model = EquipmentTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
+        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.data_table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 border: none;
                 gridline-color: {COLORS['gray_200']};
             }}
@@ -575,7 +1002,7 @@ class DashboardPage(QWidget):
                 border: none;
                 font-weight: bold;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
             }}
         """)
@@ -602,23 +1029,30 @@ class DashboardPage(QWidget):
         self.upload_btn.setEnabled(False)
         self.upload_btn.setText("Uploading...")
         self.status_label.setText("Processing file...")
-        self.status_label.setStyleSheet(f"color: {COLORS['gray_500']};")
+        self.status_label.setStyleSheet(_STATUS_QSS['pending'])
         self.status_label.show()
         
-        try:
-            result = api.upload_csv(filepath)
-            self.current_data = result
-            
-            # Fetch full dataset details
-            dataset_detail = api.get_dataset_detail(result['dataset_id'])
-            
-            self.status_label.setText(f"✓ Successfully uploaded {result['filename']}")
-            self.status_label.setStyleSheet(f"color: {COLORS['success']}; font-weight: bold;")
-            
-            # Update UI with data
-            self.display_data(result['summary'], dataset_detail.get('equipment', []))
-            
-        except requests.exceptions.HTTPError as e:
+        # The upload response already includes the equipment rows, so a single
+        # round trip is enough (no follow-up fetch of /datasets/<id>/)
+        worker = ApiWorker(api.upload_csv, filepath)
+        worker.signals.result.connect(_current_session_only(self._on_upload_done))
+        worker.signals.error.connect(_current_session_only(self._on_upload_error))
+        worker.signals.finished.connect(self._on_upload_finished)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_upload_done(self, result):
+        """Show the uploaded dataset once the worker returns."""
+        self.current_data = result
+        
+        self.status_label.setText(f"✓ Successfully uploaded {result['filename']}")
+        self.status_label.setStyleSheet(_STATUS_QSS['success'])
+        
+        # Update UI with data
+        self.display_data(result['summary'], result.get('equipment', []))
+    
+    def _on_upload_error(self, e):
+        """Report a failed upload in the status label."""
+        if isinstance(e, requests.exceptions.HTTPError):
             error_msg = "Upload failed"
             if e.response is not None:
                 try:
@@ -627,48 +1061,55 @@ class DashboardPage(QWidget):
                 except:
                     pass
             self.status_label.setText(f"✗ {error_msg}")
-            self.status_label.setStyleSheet(f"color: {COLORS['error']}; font-weight: bold;")
-        except Exception as e:
+        else:
             self.status_label.setText(f"✗ Error: {str(e)}")
-            self.status_label.setStyleSheet(f"color: {COLORS['error']}; font-weight: bold;")
-        finally:
-            self.upload_btn.setEnabled(True)
-            self.upload_btn.setText("Select CSV File")
+        self.status_label.setStyleSheet(_STATUS_QSS['error'])
+    
+    def _on_upload_finished(self):
+        """Re-enable the upload button once the request completes."""
+        self.upload_btn.setEnabled(True)
+        self.upload_btn.setText("Select CSV File")
     
     def display_data(self, summary, equipment):
         """Display the uploaded data in stats, charts, and table."""
-        # Clear previous widgets
-        for i in reversed(range(self.stats_container.layout().count())):
-            self.stats_container.layout().itemAt(i).widget().setParent(None)
-        
-        for i in reversed(range(self.charts_container.layout().count())):
-            self.charts_container.layout().itemAt(i).widget().setParent(None)
+        # Drop the previous row of cards as one widget tree
+        if self.stats_inner is not None:
+            self.stats_inner.hide()
+            self.stats_inner.deleteLater()
         
         # Add stat cards
-        stats_layout = self.stats_container.layout()
+        self.stats_inner = QWidget()
+        stats_layout = QHBoxLayout(self.stats_inner)
+        stats_layout.setSpacing(16)
+        stats_layout.setContentsMargins(0, 0, 0, 0)
         stats_layout.addWidget(StatCard("Total Equipment", summary['total_count'], COLORS['primary']))
         stats_layout.addWidget(StatCard("Avg Flowrate", summary['avg_flowrate'], COLORS['success']))
         stats_layout.addWidget(StatCard("Avg Pressure", summary['avg_pressure'], COLORS['warning']))
         stats_layout.addWidget(StatCard("Avg Temperature", summary['avg_temperature'], COLORS['error']))
+        self.stats_container.layout().addWidget(self.stats_inner)
         self.stats_container.show()
         
-        # Create charts
-        charts_layout = self.charts_container.layout()
-        
+        # Re-plot charts on the existing canvases. Repaints are held while each
+        # axes is rebuilt and draw_idle() coalesces the redraw into one event
         # Bar chart
-        bar_canvas = MatplotlibCanvas(self, width=6, height=4)
-        if summary.get('avg_by_type'):
-            types = list(summary['avg_by_type']['Flowrate'].keys())
-            flowrates = list(summary['avg_by_type']['Flowrate'].values())
-            pressures = list(summary['avg_by_type']['Pressure'].values())
-            temperatures = list(summary['avg_by_type']['Temperature'].values())
+        bar_canvas = self.bar_canvas
+        bar_canvas.setUpdatesEnabled(False)
+        bar_canvas.axes.clear()
+        by_type = summary.get('avg_by_type')
+        # A header-only CSV yields empty per-type mappings; plot nothing then
+        if by_type and by_type.get('Flowrate'):
+            import numpy as np  # already loaded by matplotlib
+            
+            types, flowrates = zip(*by_type['Flowrate'].items())
+            pressures = [by_type['Pressure'][t] for t in types]
+            temperatures = [by_type['Temperature'][t] for t in types]
             
-            x = range(len(types))
+            x = np.arange(len(types))
             width = 0.25
             
-            bar_canvas.axes.bar([i - width for i in x], flowrates, width, label='Flowrate', color='#2563eb')
+            bar_canvas.axes.bar(x - width, flowrates, width, label='Flowrate', color='#2563eb')
             bar_canvas.axes.bar(x, pressures, width, label='Pressure', color='#10b981')
-            bar_canvas.axes.bar([i + width for i in x], temperatures, width, label='Temperature', color='#f59e0b')
+            bar_canvas.axes.bar(x + width, temperatures, width, label='Temperature', color='#f59e0b')
             
             bar_canvas.axes.set_xlabel('Equipment Type')
             bar_canvas.axes.set_ylabel('Average Value')
@@ -677,15 +1118,13 @@ class DashboardPage(QWidget):
             bar_canvas.axes.set_xticklabels(types, rotation=45, ha='right')
             bar_canvas.axes.legend()
             bar_canvas.fig.tight_layout()
-        
-        bar_frame = QFrame()
-        bar_frame.setStyleSheet(f"background-color: {COLORS['white']}; border-radius: 8px;")
-        bar_layout = QVBoxLayout(bar_frame)
-        bar_layout.addWidget(bar_canvas)
-        charts_layout.addWidget(bar_frame)
+        bar_canvas.draw_idle()
+        bar_canvas.setUpdatesEnabled(True)
         
         # Pie chart
-        pie_canvas = MatplotlibCanvas(self, width=5, height=4)
+        pie_canvas = self.pie_canvas
+        pie_canvas.setUpdatesEnabled(False)
+        pie_canvas.axes.clear()
         if summary.get('type_distribution'):
             labels = list(summary['type_distribution'].keys())
             sizes = list(summary['type_distribution'].values())
@@ -694,29 +1133,27 @@ class DashboardPage(QWidget):
             pie_canvas.axes.pie(sizes, labels=labels, colors=colors_list[:len(labels)],
                                autopct='%1.1f%%', startangle=90)
             pie_canvas.axes.set_title('Equipment Type Distribution')
-        
-        pie_frame = QFrame()
-        pie_frame.setStyleSheet(f"background-color: {COLORS['white']}; border-radius: 8px;")
-        pie_layout = QVBoxLayout(pie_frame)
-        pie_layout.addWidget(pie_canvas)
-        charts_layout.addWidget(pie_frame)
+        pie_canvas.draw_idle()
+        pie_canvas.setUpdatesEnabled(True)
         
         self.charts_container.show()
         
-        # Populate table
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels(['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature'])
-        self.data_table.setRowCount(len(equipment))
-        
-        for row, eq in enumerate(equipment):
-            self.data_table.setItem(row, 0, QTableWidgetItem(eq['name']))
-            self.data_table.setItem(row, 1, QTableWidgetItem(eq['equipment_type']))
-            self.data_table.setItem(row, 2, QTableWidgetItem(str(eq['flowrate'])))
-            self.data_table.setItem(row, 3, QTableWidgetItem(str(eq['pressure'])))
-            self.data_table.setItem(row, 4, QTableWidgetItem(str(eq['temperature'])))
-        
-        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Populate table (one model reset instead of a QTableWidgetItem per cell).
+        # The Stretch header is set once in setup_ui; holding updates keeps the
+        # reset and the header's geometry pass to a single repaint
+        self.data_table.setUpdatesEnabled(False)
+        self.table_model.set_rows(equipment)
+        self.data_table.setUpdatesEnabled(True)
         self.table_container.show()
+    
+    def clear_data(self):
+        """Hide the previous user's results, as on a fresh dashboard."""
+        self.current_data = None
+        self.status_label.hide()
+        self.stats_container.hide()
+        self.charts_container.hide()
+        self.table_model.set_rows([])
+        self.table_container.hide()
 
 
 # ========== History Page ==========
@@ -726,6 +1163,21 @@ class HistoryPage(QWidget):
     
     def __init__(self):
         super().__init__()
+        self._inflight = False
+        self._shown = None  # dataset list the rows are currently bound to
+        
+        # Rapid Refresh clicks collapse into one forced reload
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self._reload)
+        
+        # One save dialog reused for every download
+        self._save_dialog = QFileDialog(self, "Save PDF Report")
+        self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dialog.setNameFilter("PDF Files (*.pdf)")
+        self._save_dialog.setDefaultSuffix("pdf")
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -742,7 +1194,7 @@ class HistoryPage(QWidget):
         header_layout.addStretch()
         
         refresh_btn = StyledButton("🔄 Refresh", 'secondary')
-        refresh_btn.clicked.connect(self.load_data)
+        refresh_btn.clicked.connect(self._schedule_refresh)
         header_layout.addWidget(refresh_btn)
         
         layout.addLayout(header_layout)
@@ -759,123 +1211,147 @@ class HistoryPage(QWidget):
         layout.addWidget(info_label)
         
         # Scroll area for history items
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setStyleSheet("QScrollArea { border: none; }")
         
         self.history_container = QWidget()
         self.history_layout = QVBoxLayout(self.history_container)
         self.history_layout.setSpacing(12)
         self.history_layout.setAlignment(Qt.AlignTop)
         
-        scroll.setWidget(self.history_container)
-        layout.addWidget(scroll)
+        # Empty/error message, shown in place of the rows
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self.message_label.hide()
+        self.history_layout.addWidget(self.message_label)
+        
+        # Row widgets are kept and re-bound on each refresh
+        self._row_pool = []
+        
+        self.scroll.setWidget(self.history_container)
+        layout.addWidget(self.scroll)
         
         # Load data on init
         self.load_data()
     
-    def load_data(self):
-        """Load datasets from the API."""
-        # Clear existing items
-        for i in reversed(range(self.history_layout.count())):
-            widget = self.history_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        
-        try:
-            datasets = api.get_datasets()
-            
-            if not datasets:
-                empty_label = QLabel("No uploads yet. Upload a CSV file from the Dashboard to see it here.")
-                empty_label.setStyleSheet(f"color: {COLORS['gray_500']}; padding: 40px;")
-                empty_label.setAlignment(Qt.AlignCenter)
-                self.history_layout.addWidget(empty_label)
-            else:
-                for dataset in datasets:
-                    self.add_history_item(dataset)
-                    
-        except Exception as e:
-            error_label = QLabel(f"Failed to load history: {str(e)}")
-            error_label.setStyleSheet(f"color: {COLORS['error']}; padding: 20px;")
-            self.history_layout.addWidget(error_label)
-    
-    def add_history_item(self, dataset):
-        """Add a single history item to the list."""
-        item = QFrame()
-        item.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['white']};
-                border-radius: 8px;
-            }}
-            QFrame:hover {{
-                background-color: {COLORS['gray_50']};
-            }}
-        """)
-        
-        item_layout = QHBoxLayout(item)
-        item_layout.setContentsMargins(16, 12, 16, 12)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        
-        filename = QLabel(f"📄 {dataset['filename']}")
-        filename.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {COLORS['gray_800']};")
-        info_layout.addWidget(filename)
+    def load_data(self, fresh=False):
+        """Load datasets from the API on a worker thread."""
+        # A request already in flight will deliver current data; don't queue another
+        if self._inflight:
+            return
         
-        # Format date
-        upload_date = datetime.fromisoformat(dataset['uploaded_at'].replace('Z', '+00:00'))
-        date_str = upload_date.strftime('%Y-%m-%d %H:%M')
+        # The rows already show the API's cached list; nothing changed since
+        if not fresh and self._shown is not None and api.cached_datasets() is self._shown:
+            return
+        self._inflight = True
         
-        meta = QLabel(f"Uploaded: {date_str} • {dataset['equipment_count']} equipment records")
-        meta.setStyleSheet(f"color: {COLORS['gray_500']}; font-size: 12px;")
-        info_layout.addWidget(meta)
+        worker = ApiWorker(api.get_datasets, fresh=fresh)
+        worker.signals.result.connect(_current_session_only(self._on_datasets_loaded))
+        worker.signals.error.connect(_current_session_only(self._on_load_error))
+        worker.signals.finished.connect(_current_session_only(self._on_load_finished))
+        QThreadPool.globalInstance().start(worker)
+    
+    @pyqtSlot()
+    def _schedule_refresh(self):
+        """(Re)start the debounce timer for a Refresh click."""
+        self._refresh_timer.start()
+    
+    @pyqtSlot()
+    def _reload(self):
+        """Reload the list, bypassing the API cache."""
+        self.load_data(fresh=True)
+    
+    def _on_load_finished(self):
+        """Allow the next load once the current request completes."""
+        self._inflight = False
+    
+    def clear_data(self):
+        """Hide all rows and messages until the next load."""
+        self._shown = None
+        self._inflight = False  # a load still running belongs to the old session
+        self.message_label.hide()
+        for row in self._row_pool:
+            row.hide()
+    
+    def _get_row(self, index):
+        """Return the pooled row at index, creating it if the pool is short."""
+        if index < len(self._row_pool):
+            return self._row_pool[index]
+        
+        row = HistoryRow()
+        row.pdf_btn.clicked.connect(functools.partial(self._on_pdf_clicked, row))
+        self.history_layout.addWidget(row)
+        self._row_pool.append(row)
+        return row
+    
+    def _show_message(self, text, style, alignment=Qt.AlignLeft):
+        """Hide all rows and show a message in their place."""
+        for row in self._row_pool:
+            row.hide()
+        self.message_label.setText(text)
+        self.message_label.setStyleSheet(style)
+        self.message_label.setAlignment(alignment)
+        self.message_label.show()
+    
+    def _on_datasets_loaded(self, datasets):
+        """Re-bind the pooled rows to the fetched datasets."""
+        self._shown = datasets
+        if not datasets:
+            self._show_message(
+                "No uploads yet. Upload a CSV file from the Dashboard to see it here.",
+                _EMPTY_MESSAGE_QSS,
+                Qt.AlignCenter
+            )
+            return
         
-        # Summary stats
-        if dataset.get('summary'):
-            summary = dataset['summary']
-            stats_text = f"Avg Flow: {summary.get('avg_flowrate', 'N/A')} • Avg Pressure: {summary.get('avg_pressure', 'N/A')} • Avg Temp: {summary.get('avg_temperature', 'N/A')}"
-            stats_label = QLabel(stats_text)
-            stats_label.setStyleSheet(f"""
-                background-color: {COLORS['gray_100']};
-                color: {COLORS['gray_700']};
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 11px;
-            """)
-            info_layout.addWidget(stats_label)
-        
-        item_layout.addLayout(info_layout)
-        item_layout.addStretch()
-        
-        # Action buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(8)
-        
-        pdf_btn = StyledButton("📥 PDF", 'success')
-        pdf_btn.clicked.connect(lambda checked, d=dataset: self.download_pdf(d))
-        btn_layout.addWidget(pdf_btn)
-        
-        item_layout.addLayout(btn_layout)
-        
-        self.history_layout.addWidget(item)
+        # Hold repaints so the rows are laid out and painted once
+        self.history_container.setUpdatesEnabled(False)
+        self.message_label.hide()
+        for i, dataset in enumerate(datasets):
+            row = self._get_row(i)
+            row.set_dataset(dataset)
+            row.show()
+        
+        # Hide rows left over from a longer list
+        for row in self._row_pool[len(datasets):]:
+            row.hide()
+        self.history_container.setUpdatesEnabled(True)
+        self.history_container.update()
+    
+    def _on_load_error(self, e):
+        """Show an error in place of the history list."""
+        self._shown = None
+        self._show_message(
+            f"Failed to load history: {str(e)}",
+            _ERROR_MESSAGE_QSS
+        )
+    
+    def _on_pdf_clicked(self, row, _checked=False):
+        """Forward a row's PDF button click, dropping the checked flag."""
+        self.download_pdf(row.dataset)
     
     def download_pdf(self, dataset):
         """Download PDF report for a dataset."""
-        save_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save PDF Report",
-            f"report_{dataset['filename']}.pdf",
-            "PDF Files (*.pdf)"
-        )
-        
-        if not save_path:
+        default_name = dataset.get('_pdf_default_name') or f"report_{dataset['filename']}.pdf"
+        self._save_dialog.selectFile(default_name)
+        if not self._save_dialog.exec_():
             return
+        save_path = self._save_dialog.selectedFiles()[0]
         
-        try:
-            api.download_pdf_report(dataset['id'], save_path)
-            QMessageBox.information(self, "Success", f"PDF saved to:\n{save_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to download PDF:\n{str(e)}")
+        # Download on a worker so the window keeps painting meanwhile
+        worker = ApiWorker(api.download_pdf_report, dataset['id'], save_path)
+        worker.signals.result.connect(_current_session_only(self._on_pdf_saved))
+        worker.signals.error.connect(_current_session_only(self._on_pdf_error))
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_pdf_saved(self, save_path):
+        """Confirm where the downloaded report was written."""
+        QMessageBox.information(self, "Success", f"PDF saved to:\n{save_path}")
+    
+    def _on_pdf_error(self, e):
+        """Report a failed PDF download."""
+        QMessageBox.critical(self, "Error", f"Failed to download PDF:\n{str(e)}")
 
 
 # ========== Main Window ==========
@@ -888,13 +1364,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("ChemEquipViz - Chemical Equipment Visualizer")
         self.setMinimumSize(1200, 800)
         
-        # Set application-wide style
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {COLORS['gray_50']};
-            }}
-        """)
-        
         # Create stacked widget for page switching
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
@@ -902,6 +1371,8 @@ class MainWindow(QMainWindow):
         # Create pages
         self.login_page = LoginPage(self.on_login_success)
         self.main_page = None
+        self.dashboard_page = None
+        self.history_page = None
         
         # Start with login page
         self.stack.addWidget(self.login_page)
@@ -909,6 +1380,13 @@ class MainWindow(QMainWindow):
     
     def on_login_success(self):
         """Called when user successfully logs in."""
+        # The main page is built on the first login and kept across logouts
+        if self.main_page is not None:
+            self.user_label.setText(f"Welcome, {api.user['username']}")
+            self.show_page(0)
+            self.stack.setCurrentWidget(self.main_page)
+            return
+        
         # Create main page with navbar and content
         self.main_page = QWidget()
         main_layout = QVBoxLayout(self.main_page)
@@ -917,45 +1395,47 @@ class MainWindow(QMainWindow):
         
         # Navbar
         navbar = QFrame()
-        navbar.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['primary']},
-                    stop:1 {COLORS['primary_dark']}
-                );
-            }}
-        """)
+        navbar.setObjectName("navbar")
+        
+        # Gradient background painted from a palette brush, not parsed from QSS
+        gradient = QLinearGradient(0, 0, 1, 0)
+        gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor(COLORS['primary']))
+        gradient.setColorAt(1, QColor(COLORS['primary_dark']))
+        palette = navbar.palette()
+        palette.setBrush(QPalette.Window, QBrush(gradient))
+        navbar.setPalette(palette)
+        navbar.setAutoFillBackground(True)
         navbar.setFixedHeight(60)
         navbar_layout = QHBoxLayout(navbar)
         navbar_layout.setContentsMargins(20, 0, 20, 0)
         
         # App title
         title = QLabel("🧪 ChemEquipViz")
-        title.setStyleSheet("color: white; font-size: 20px; font-weight: bold;")
+        title.setObjectName("navTitle")
         navbar_layout.addWidget(title)
         
         navbar_layout.addStretch()
         
         # Navigation buttons
         self.dashboard_btn = QPushButton("Dashboard")
-        self.dashboard_btn.setStyleSheet(self._nav_btn_style())
+        self.dashboard_btn.setObjectName("navBtn")
         self.dashboard_btn.setCursor(Qt.PointingHandCursor)
-        self.dashboard_btn.clicked.connect(lambda: self.show_page(0))
+        self.dashboard_btn.clicked.connect(self._show_dashboard)
         navbar_layout.addWidget(self.dashboard_btn)
         
         self.history_btn = QPushButton("History")
-        self.history_btn.setStyleSheet(self._nav_btn_style())
+        self.history_btn.setObjectName("navBtn")
         self.history_btn.setCursor(Qt.PointingHandCursor)
-        self.history_btn.clicked.connect(lambda: self.show_page(1))
+        self.history_btn.clicked.connect(self._show_history)
         navbar_layout.addWidget(self.history_btn)
         
         navbar_layout.addSpacing(20)
         
         # User info
-        user_label = QLabel(f"Welcome, {api.user['username']}")
-        user_label.setStyleSheet("color: #bfdbfe;")
-        navbar_layout.addWidget(user_label)
+        self.user_label = QLabel(f"Welcome, {api.user['username']}")
+        self.user_label.setObjectName("navUser")
+        navbar_layout.addWidget(self.user_label)
         
         logout_btn = StyledButton("Logout", 'secondary')
         logout_btn.clicked.connect(self.logout)
@@ -963,55 +1443,75 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(navbar)
         
-        # Content area
+        # Content area (filled in by _build_content)
         self.content_stack = QStackedWidget()
-        self.dashboard_page = DashboardPage()
-        self.history_page = HistoryPage()
-        self.content_stack.addWidget(self.dashboard_page)
-        self.content_stack.addWidget(self.history_page)
-        
         main_layout.addWidget(self.content_stack)
         
         # Add main page to stack and show it
         self.stack.addWidget(self.main_page)
         self.stack.setCurrentWidget(self.main_page)
+        
+        # Let the navbar paint before the page contents are built
+        QTimer.singleShot(0, self._build_content)
     
-    def _nav_btn_style(self):
-        """Return styling for navigation buttons."""
-        return f"""
-            QPushButton {{
-                background: transparent;
-                color: #bfdbfe;
-                border: none;
-                padding: 8px 16px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.1);
-                color: white;
-                border-radius: 4px;
-            }}
-        """
+    def _build_content(self):
+        """Build the Dashboard page and reserve the History slot."""
+        self.dashboard_page = DashboardPage()
+        self.content_stack.addWidget(self.dashboard_page)
+        
+        # History is built (and fetched) the first time its tab is opened
+        self._history_placeholder = QWidget()
+        self.content_stack.addWidget(self._history_placeholder)
+    
+    @pyqtSlot()
+    def _show_dashboard(self):
+        self.show_page(0)
+    
+    @pyqtSlot()
+    def _show_history(self):
+        self.show_page(1)
     
     def show_page(self, index):
         """Switch to a different page."""
+        if self.dashboard_page is None:
+            return  # content not built yet
+        
+        # Re-clicking the current tab is a no-op; History has its own Refresh
+        if self.content_stack.currentIndex() == index:
+            return
+        
+        if index == 1 and self.history_page is None:
+            # First visit: HistoryPage loads its data on construction
+            self.history_page = HistoryPage()
+            self.content_stack.removeWidget(self._history_placeholder)
+            self._history_placeholder.deleteLater()
+            self.content_stack.insertWidget(1, self.history_page)
+            self.content_stack.setCurrentIndex(index)
+            return
+        
         self.content_stack.setCurrentIndex(index)
         
         # Refresh history when switching to it
         if index == 1:
             self.history_page.load_data()
     
+    @pyqtSlot()
     def logout(self):
         """Log out the current user."""
-        api.logout()
-        
-        # Remove main page and show login
-        self.stack.removeWidget(self.main_page)
-        self.main_page = None
-        
-        # Create fresh login page
-        self.login_page = LoginPage(self.on_login_success)
-        self.stack.addWidget(self.login_page)
+        token = api.logout()
+        if token:
+            # The server call can retry for a while if the backend is down;
+            # the UI returns to the login page without waiting for it
+            QThreadPool.globalInstance().start(ApiWorker(api.revoke_token, token))
+        
+        # Keep the main page for the next login, minus this user's data
+        if self.dashboard_page is not None:
+            self.dashboard_page.clear_data()
+        if self.history_page is not None:
+            self.history_page.clear_data()
+        
+        # Back to a blank login form
+        self.login_page.reset()
         self.stack.setCurrentWidget(self.login_page)
 
 
@@ -1020,6 +1520,11 @@ class MainWindow(QMainWindow):
 def main():
     """Application entry point."""
     app = QApplication(sys.argv)
+    app.setStyleSheet(GLOBAL_QSS)
+    
+    # API workers spend their time waiting on the network, not the CPU, so
+    # allow more of them than the default (one per core) to run at once
+    QThreadPool.globalInstance().setMaxThreadCount(MAX_CONCURRENT_REQUESTS)
     
     # Set application metadata
     app.setApplicationName("ChemEquipViz")